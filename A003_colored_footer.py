@@ -1,15 +1,72 @@
 import fitz  # PyMuPDF
+import itertools
 import json
+import numpy as np
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 # Import the standard PageLayout from protocol
 from pdf_extractor_protocol import PageLayout
 
-@dataclass
+# pyahocorasick is optional: when present, footer-indicator matching uses a
+# DFA built once at import (a single linear C scan with no backtracking,
+# which adds up over tens of thousands of pages in a corpus run)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson is optional: its Rust encoder is several times faster than the
+# stdlib's pure-Python path on multi-MB page dumps, but the stdlib result
+# is byte-for-byte compatible so nothing requires it
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+_FOOTER_INDICATORS = ('page', 'copyright', '©', '®', 'www.', '.com', '.org',
+                      'all rights reserved', 'confidential')
+
+# White fill, compared as a tuple so the check allocates nothing per drawing
+_WHITE = (1.0, 1.0, 1.0)
+
+# Compiled once at import: common footer indicators plus a digit probe, so
+# footer detection is a single C-level scan instead of ~9 Python substring
+# scans and a per-character isdigit() loop per page
+_FOOTER_RE = re.compile('|'.join(re.escape(word) for word in _FOOTER_INDICATORS), re.IGNORECASE)
+_DIGIT_RE = re.compile(r'\d')
+
+if ahocorasick is not None:
+    _FOOTER_AUTOMATON = ahocorasick.Automaton()
+    for _word in _FOOTER_INDICATORS:
+        _FOOTER_AUTOMATON.add_word(_word, _word)
+    _FOOTER_AUTOMATON.make_automaton()
+else:
+    _FOOTER_AUTOMATON = None
+
+def _has_footer_indicator(text: str) -> bool:
+    """Check text for any footer indicator, preferring the Aho-Corasick DFA."""
+    if _FOOTER_AUTOMATON is not None:
+        return next(_FOOTER_AUTOMATON.iter(text.lower()), None) is not None
+    return _FOOTER_RE.search(text) is not None
+
+@dataclass(slots=True)
 class TextBlock:
-    """Internal data structure for text blocks with formatting info."""
+    """Internal data structure for text blocks with formatting info.
+
+    slots=True drops the per-instance __dict__ — large PDFs can hold tens of
+    thousands of these in memory at once during classification.
+    """
     text: str
     bbox: Tuple[float, float, float, float]  # x0, y0, x1, y1
     font_size: float
@@ -25,17 +82,59 @@ class PDFColumnExtractor:
 
     Args:
         pdf_path: Path to the PDF file to process
+        stream: Optional in-memory PDF bytes; when given, the document is
+            opened from them instead of reading pdf_path from disk
     """
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, stream: Optional[bytes] = None):
         self.pdf_path = pdf_path
-        self.doc = fitz.open(pdf_path)
-        
-    def detect_vertical_lines(self, page) -> List[Tuple[float, float, float, float]]:
-        """Detect vertical lines in the page that might separate columns"""
-        vertical_lines = []
-        
+        if stream is not None:
+            self.doc = fitz.open(stream=stream, filetype="pdf")
+        else:
+            self.doc = fitz.open(pdf_path)
+
+        # Most documents use a single page size. When the first/middle/last
+        # pages agree, the header/footer thresholds and the candidate
+        # separator grid are computed once here instead of once per page.
+        self._header_thr: Optional[float] = None
+        self._footer_thr: Optional[float] = None
+        self._sep_cands: Optional[np.ndarray] = None
+        page_count = len(self.doc)
+        if page_count:
+            rect0 = self.doc[0].rect
+            probes = {0, page_count // 2, page_count - 1}
+            if all(self.doc[i].rect == rect0 for i in probes):
+                self._header_thr = rect0.height * 0.15
+                self._footer_thr = rect0.height * 0.95
+                self._sep_cands = np.arange(int(rect0.width * 0.3),
+                                            int(rect0.width * 0.7), 10,
+                                            dtype=np.float32)
+        
+    def _extract_page_primitives(self, page):
+        """
+        Fetch the page's TextPage and drawings in a single round-trip each.
+
+        Text-block extraction, vertical-line detection and colored-background
+        detection all read from these two structures, so building them once
+        per page avoids re-parsing the content stream per helper.
+        """
+        textpage = page.get_textpage()
         try:
             drawings = page.get_drawings()
+        except Exception as e:
+            print(f"Warning: Could not get drawings on page {page.number}: {e}")
+            drawings = []
+        return textpage, drawings
+
+    def detect_vertical_lines(self, page, drawings=None) -> List[Tuple[float, float, float, float]]:
+        """Detect vertical lines in the page that might separate columns.
+
+        Pass drawings to reuse an already-parsed drawing list.
+        """
+        vertical_lines = []
+
+        try:
+            if drawings is None:
+                drawings = page.get_drawings()
             for drawing in drawings:
                 if "items" in drawing:
                     for item in drawing["items"]:
@@ -46,7 +145,12 @@ class PDFColumnExtractor:
                                 vertical_lines.append((x1, y1, x2, y2))
         except Exception as e:
             print(f"Warning: Could not detect vertical lines on page {page.number}: {e}")
-        
+
+        # get_cdrawings() re-parses the same vector stream, so only fall back
+        # to it when the primary pass found nothing usable
+        if vertical_lines:
+            return self._dedupe_lines(vertical_lines)
+
         # Alternative method: look for vertical lines in vector graphics
         try:
             # Get vector graphics paths
@@ -60,37 +164,80 @@ class PDFColumnExtractor:
                                 vertical_lines.append((x1, y1, x2, y2))
         except:
             pass  # Some PDFs might not have this method
-        
-        return vertical_lines
+
+        return self._dedupe_lines(vertical_lines)
+
+    @staticmethod
+    def _dedupe_lines(lines: List[Tuple[float, float, float, float]]) -> List[Tuple[float, float, float, float]]:
+        """Drop coalesced duplicate lines so downstream scans don't repeat work."""
+        seen = set()
+        unique = []
+        for line in lines:
+            key = (round(line[0], 1), round(line[1], 1), round(line[2], 1), round(line[3], 1))
+            if key not in seen:
+                seen.add(key)
+                unique.append(line)
+        return unique
     
-    def get_text_blocks(self, page) -> List[TextBlock]:
-        """Extract text blocks with their positions and formatting"""
+    def get_text_blocks(self, page, textpage=None) -> List[TextBlock]:
+        """Extract text blocks with their positions and formatting.
+
+        Pass an existing TextPage to reuse it; page.get_text("dict") builds a
+        fresh TextPage on every call, which is the expensive part.
+        """
+        blocks, _ = self._get_text_blocks_soa(page, textpage)
+        return blocks
+
+    def _get_text_blocks_soa(self, page, textpage=None) -> Tuple[List[TextBlock], np.ndarray]:
+        """Extract text blocks plus a preallocated (N, 4) float32 bbox array.
+
+        The bbox array is counted and filled in two passes over the already
+        extracted dict, so coordinates land unboxed in one buffer instead of
+        N four-tuples of PyFloats. Callers that want the structure-of-arrays
+        view (separator search, region classification) read it directly; the
+        TextBlock list stays the API surface for everything else.
+        """
         text_blocks = []
-        
+        bboxes = np.empty((0, 4), dtype=np.float32)
+
         try:
-            blocks = page.get_text("dict")
-            for block in blocks.get("blocks", []):
+            if textpage is None:
+                textpage = page.get_textpage()
+            blocks = textpage.extractDICT()
+            page_blocks = blocks.get("blocks", [])
+
+            # First pass: count lines so the bbox buffer is sized exactly once
+            n = sum(len(block["lines"]) for block in page_blocks if "lines" in block)
+            bboxes = np.empty((n, 4), dtype=np.float32)
+
+            k = 0
+            for block in page_blocks:
                 if "lines" in block:
                     for line in block["lines"]:
                         line_text = ""
                         font_size = 0
                         font_name = ""
-                        
+
                         for span in line.get("spans", []):
                             line_text += span.get("text", "")
                             font_size = max(font_size, span.get("size", 0))
                             if not font_name:
                                 font_name = span.get("font", "")
-                        
+
                         if line_text.strip():
                             bbox = line.get("bbox", [0, 0, 0, 0])
                             if len(bbox) >= 4:
+                                bboxes[k] = bbox[:4]
                                 text_blocks.append(TextBlock(
                                     text=line_text.strip(),
                                     bbox=tuple(bbox[:4]),  # Ensure only 4 values
                                     font_size=font_size,
                                     font_name=font_name
                                 ))
+                                k += 1
+
+            # Blank or malformed lines were skipped; trim to the filled prefix
+            bboxes = bboxes[:k]
         except Exception as e:
             print(f"Warning: Error extracting text blocks from page {page.number}: {e}")
             # Fallback to simple text extraction
@@ -106,16 +253,25 @@ class PDFColumnExtractor:
                     ))
             except:
                 pass
-        
-        return text_blocks
+            bboxes = np.asarray([block.bbox for block in text_blocks], dtype=np.float32).reshape(-1, 4)
+
+        return text_blocks, bboxes
     
-    def find_column_separator(self, page, text_blocks: List[TextBlock]) -> Optional[float]:
-        """Find the column separator position"""
-        page_rect = page.rect
-        page_width = page_rect.width
-        
+    def find_column_separator(self, page, text_blocks: List[TextBlock],
+                              vertical_lines: Optional[List[Tuple[float, float, float, float]]] = None,
+                              page_width: Optional[float] = None,
+                              bboxes: Optional[np.ndarray] = None) -> Optional[float]:
+        """Find the column separator position.
+
+        Pass vertical_lines, page_width and the (N, 4) bbox array to reuse
+        already-computed values.
+        """
+        if page_width is None:
+            page_width = page.rect.width
+
         # First, try to find vertical lines
-        vertical_lines = self.detect_vertical_lines(page)
+        if vertical_lines is None:
+            vertical_lines = self.detect_vertical_lines(page)
         if vertical_lines:
             # Find the longest vertical line near the center
             center_x = page_width / 2
@@ -137,111 +293,129 @@ class PDFColumnExtractor:
         # If no vertical lines found, analyze text distribution
         if not text_blocks:
             return page_width / 2
-            
-        # Group text blocks by their x-position
-        left_blocks = []
-        right_blocks = []
-        
-        # Try different separator positions and find the best one
-        for separator_x in range(int(page_width * 0.3), int(page_width * 0.7), 10):
-            left_count = sum(1 for block in text_blocks if block.bbox[2] < separator_x)
-            right_count = sum(1 for block in text_blocks if block.bbox[0] > separator_x)
-            
-            if left_count > 0 and right_count > 0:
-                return float(separator_x)
-        
+
+        # Score every candidate separator in one NumPy broadcast and keep the
+        # most balanced one, instead of a Python scan over candidates x blocks
+        # that stopped at the first barely-viable position
+        if bboxes is None:
+            bboxes = np.asarray([block.bbox for block in text_blocks], dtype=np.float32)
+        x0s = bboxes[:, 0]
+        x1s = bboxes[:, 2]
+        candidates = self._sep_cands
+        if candidates is None:
+            candidates = np.arange(int(page_width * 0.3), int(page_width * 0.7), 10, dtype=np.float32)
+
+        left_counts = (x1s[:, None] < candidates).sum(axis=0)
+        right_counts = (x0s[:, None] > candidates).sum(axis=0)
+
+        balance = np.minimum(left_counts, right_counts)
+        if balance.max() > 0:
+            return float(candidates[np.argmax(balance)])
+
         return page_width / 2
     
-    def detect_colored_backgrounds(self, page) -> List[Tuple[float, float, float, float]]:
-        """Detect rectangles with colored backgrounds that might indicate footers"""
+    def detect_colored_backgrounds(self, page, drawings=None) -> np.ndarray:
+        """Detect rectangles with colored backgrounds that might indicate footers.
+
+        Pass drawings to reuse an already-parsed drawing list. Returns an
+        (F, 4) float32 array of rects so downstream filtering and
+        containment tests stay inside NumPy's broadcast kernels.
+        """
         colored_regions = []
-        
+
         try:
             # Get all drawings/shapes on the page
-            drawings = page.get_drawings()
+            if drawings is None:
+                drawings = page.get_drawings()
             for drawing in drawings:
-                if "items" in drawing and "fill" in drawing:
-                    # Check if this drawing has a fill color (background)
-                    fill_color = drawing.get("fill")
-                    if fill_color and fill_color != [1.0, 1.0, 1.0]:  # Not white background
-                        # Extract rectangle bounds from the drawing
-                        if "rect" in drawing:
-                            rect = drawing["rect"]
-                            if len(rect) >= 4:
-                                colored_regions.append(tuple(rect[:4]))
+                # Unfilled drawings (strokes, clips) are the common case —
+                # skip them before any comparison work
+                fill_color = drawing.get("fill")
+                if not fill_color or "items" not in drawing:
+                    continue
+                if tuple(fill_color) == _WHITE:  # White background
+                    continue
+                # Extract rectangle bounds from the drawing
+                rect = drawing.get("rect")
+                if rect is not None and len(rect) >= 4:
+                    colored_regions.append(tuple(rect[:4]))
         except Exception as e:
             print(f"Warning: Could not detect colored backgrounds on page {page.number}: {e}")
-        
-        return colored_regions
+
+        return np.asarray(colored_regions, dtype=np.float32).reshape(-1, 4)
     
-    def classify_text_regions(self, page, text_blocks: List[TextBlock], page_height: float, 
-                            separator_x: float) -> Dict[str, List[TextBlock]]:
-        """Classify text blocks into header, footer, left column, right column"""
+    def classify_text_regions(self, page, text_blocks: List[TextBlock], page_height: float,
+                            separator_x: float,
+                            colored_regions: Optional[np.ndarray] = None,
+                            bboxes: Optional[np.ndarray] = None) -> Dict[str, List[TextBlock]]:
+        """Classify text blocks into header, footer, left column, right column.
+
+        Pass colored_regions and the (N, 4) bbox array to reuse
+        already-computed values.
+        """
         # Determine header region - top 15% of page
-        header_threshold = page_height * 0.15
-        
+        header_threshold = self._header_thr
+        if header_threshold is None:
+            header_threshold = page_height * 0.15
+
         # Detect colored backgrounds that might indicate footers
-        colored_regions = self.detect_colored_backgrounds(page)
-        footer_regions = []
-        
-        # Look for colored regions in the bottom half of the page
-        for region in colored_regions:
-            x0, y0, x1, y1 = region
-            if y0 > page_height * 0.5:  # Bottom half of page
-                footer_regions.append(region)
+        if colored_regions is None:
+            colored_regions = self.detect_colored_backgrounds(page)
+
+        # Keep colored regions in the bottom half of the page as an (F, 4)
+        # array — no per-region tuple unpacking
+        footer_regions = colored_regions[colored_regions[:, 1] > page_height * 0.5]
         
         # If no colored footer regions found, use conservative bottom 5% threshold
         # Only if there's text there and it looks like footer content
-        footer_threshold = page_height * 0.95
-        potential_footer_blocks = [block for block in text_blocks 
+        footer_threshold = self._footer_thr
+        if footer_threshold is None:
+            footer_threshold = page_height * 0.95
+        potential_footer_blocks = [block for block in text_blocks
                                  if (block.bbox[1] + block.bbox[3]) / 2 > footer_threshold]
         
         # Check if potential footer blocks look like actual footers
         has_footer = False
         if potential_footer_blocks:
-            footer_text = " ".join([block.text for block in potential_footer_blocks]).lower()
-            # Common footer indicators
-            footer_indicators = ['page', 'copyright', '©', '®', 'www.', '.com', '.org', 
-                               'all rights reserved', 'confidential']
-            if any(indicator in footer_text for indicator in footer_indicators):
+            footer_text = " ".join([block.text for block in potential_footer_blocks])
+            if _has_footer_indicator(footer_text):
                 has_footer = True
             # Also check if it's very short text (likely page numbers)
-            elif len(footer_text.strip()) < 50 and any(char.isdigit() for char in footer_text):
+            elif len(footer_text.strip()) < 50 and _DIGIT_RE.search(footer_text):
                 has_footer = True
         
-        regions = {
-            'header': [],
-            'footer': [],
-            'left_column': [],
-            'right_column': []
+        if not text_blocks:
+            return {'header': [], 'footer': [], 'left_column': [], 'right_column': []}
+
+        # Classify all blocks at once with NumPy masks instead of a Python
+        # branch (plus an inner footer-region loop) per block
+        if bboxes is None:
+            bboxes = np.asarray([block.bbox for block in text_blocks], dtype=np.float32)
+        centers_y = (bboxes[:, 1] + bboxes[:, 3]) * 0.5
+        centers_x = (bboxes[:, 0] + bboxes[:, 2]) * 0.5
+
+        # Broadcast the colored-footer containment test over all regions
+        if len(footer_regions):
+            inside = (np.all(bboxes[:, None, :2] >= footer_regions[None, :, :2], axis=-1) &
+                      np.all(bboxes[:, None, 2:] <= footer_regions[None, :, 2:], axis=-1))
+            in_colored_footer = inside.any(axis=1)
+        else:
+            in_colored_footer = np.zeros(len(text_blocks), dtype=bool)
+
+        # Classify by vertical position and footer detection
+        is_header = centers_y < header_threshold
+        is_footer = ~is_header & (in_colored_footer | (has_footer & (centers_y > footer_threshold)))
+        # Classify by horizontal position for main content
+        is_body = ~(is_header | is_footer)
+        is_left = is_body & (centers_x < separator_x)
+        is_right = is_body & ~is_left
+
+        return {
+            'header': [text_blocks[i] for i in np.flatnonzero(is_header)],
+            'footer': [text_blocks[i] for i in np.flatnonzero(is_footer)],
+            'left_column': [text_blocks[i] for i in np.flatnonzero(is_left)],
+            'right_column': [text_blocks[i] for i in np.flatnonzero(is_right)]
         }
-        
-        for block in text_blocks:
-            x0, y0, x1, y1 = block.bbox
-            center_y = (y0 + y1) / 2
-            center_x = (x0 + x1) / 2
-            
-            # Check if block is in a colored footer region
-            in_colored_footer = False
-            for footer_region in footer_regions:
-                fx0, fy0, fx1, fy1 = footer_region
-                if (x0 >= fx0 and x1 <= fx1 and y0 >= fy0 and y1 <= fy1):
-                    in_colored_footer = True
-                    break
-            
-            # Classify by vertical position and footer detection
-            if center_y < header_threshold:
-                regions['header'].append(block)
-            elif in_colored_footer or (has_footer and center_y > footer_threshold):
-                regions['footer'].append(block)
-            else:
-                # Classify by horizontal position for main content
-                if center_x < separator_x:
-                    regions['left_column'].append(block)
-                else:
-                    regions['right_column'].append(block)
-        
-        return regions
     
     def blocks_to_text(self, blocks: List[TextBlock]) -> str:
         """Convert text blocks to continuous text"""
@@ -250,49 +424,47 @@ class PDFColumnExtractor:
         
         # Sort blocks by position (top to bottom, left to right)
         sorted_blocks = sorted(blocks, key=lambda b: (b.bbox[1], b.bbox[0]))
-        
-        # Group blocks into lines based on y-position
-        lines = []
-        current_line = []
-        current_y = None
-        
-        for block in sorted_blocks:
-            block_y = (block.bbox[1] + block.bbox[3]) / 2
-            
-            if current_y is None or abs(block_y - current_y) < 10:
-                current_line.append(block)
-                current_y = block_y
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = [block]
-                current_y = block_y
-        
-        if current_line:
-            lines.append(current_line)
-        
-        # Convert lines to text
+
+        # Group into lines by integer y-band (center // line height). The old
+        # running-center comparison drifted: blocks ~5pt apart kept extending
+        # one "line" indefinitely, whereas fixed buckets are stable. Each
+        # bucket still needs its own x-sort: the outer sort is lexicographic
+        # on (y0, x0), so blocks sharing a visual line but differing slightly
+        # in y0 would otherwise come out in y0 order, not reading order.
+        def y_bucket(block: TextBlock) -> int:
+            return int(((block.bbox[1] + block.bbox[3]) * 0.5) // 10)
+
         text_lines = []
-        for line in lines:
-            line_text = " ".join(block.text for block in sorted(line, key=lambda b: b.bbox[0]))
-            text_lines.append(line_text)
-        
+        for _, line in itertools.groupby(sorted_blocks, key=y_bucket):
+            line = sorted(line, key=lambda b: b.bbox[0])
+            text_lines.append(" ".join(block.text for block in line))
+
         return "\n".join(text_lines)
     
     def extract_page_layout(self, page_num: int) -> PageLayout:
         """Extract layout information from a single page"""
         try:
             page = self.doc[page_num]
+            # page.rect is a SWIG property; pull the four floats across the
+            # C boundary once and reuse them everywhere below
             page_rect = page.rect
-            
-            # Get text blocks
-            text_blocks = self.get_text_blocks(page)
-            
+            px0, py0, px1, py1 = page_rect.x0, page_rect.y0, page_rect.x1, page_rect.y1
+            page_width = px1 - px0
+            page_height = py1 - py0
+
+
+            # One pass into the C layer: TextPage and drawings are built once
+            # and every detector below reads from them
+            textpage, drawings = self._extract_page_primitives(page)
+            text_blocks, bboxes = self._get_text_blocks_soa(page, textpage)
+            vertical_lines = self.detect_vertical_lines(page, drawings)
+            colored_regions = self.detect_colored_backgrounds(page, drawings)
+
             # Find column separator
-            separator_x = self.find_column_separator(page, text_blocks)
-            
+            separator_x = self.find_column_separator(page, text_blocks, vertical_lines, page_width, bboxes)
+
             # Classify text regions
-            regions = self.classify_text_regions(page, text_blocks, page_rect.height, separator_x)
+            regions = self.classify_text_regions(page, text_blocks, page_height, separator_x, colored_regions, bboxes)
             
             # Convert regions to text
             header_text = self.blocks_to_text(regions['header'])
@@ -307,10 +479,10 @@ class PDFColumnExtractor:
                 'footer_blocks': len(regions['footer']),
                 'left_column_blocks': len(regions['left_column']),
                 'right_column_blocks': len(regions['right_column']),
-                'vertical_lines_detected': len(self.detect_vertical_lines(page)),
-                'colored_footer_regions': len(self.detect_colored_backgrounds(page)),
+                'vertical_lines_detected': len(vertical_lines),
+                'colored_footer_regions': len(colored_regions),
                 'has_footer': len(regions['footer']) > 0,
-                'page_rect': [page_rect.x0, page_rect.y0, page_rect.x1, page_rect.y1]
+                'page_rect': [px0, py0, px1, py1]
             }
             
             return PageLayout(
@@ -319,8 +491,8 @@ class PDFColumnExtractor:
                 footer=footer_text,
                 left_column=left_column_text,
                 right_column=right_column_text,
-                page_width=page_rect.width,
-                page_height=page_rect.height,
+                page_width=page_width,
+                page_height=page_height,
                 column_separator_position=separator_x,
                 metadata=metadata
             )
@@ -340,29 +512,103 @@ class PDFColumnExtractor:
                 metadata={'error': str(e)}
             )
     
+    def iter_page_layouts(self, cache_mb: int = 64):
+        """Yield PageLayouts one page at a time.
+
+        Generator counterpart of extract_all_pages: on long PDFs only one
+        page's layout is live at a time instead of the whole document.
+
+        Args:
+            cache_mb: Soft cap in MB on MuPDF's internal store, which keeps
+                parsed fonts/images/content streams and otherwise grows
+                without bound on long walks. Shrinks are partial (50%) so
+                resources shared by nearby pages stay warm instead of being
+                evicted wholesale after every page.
+        """
+        max_store_bytes = cache_mb * (1 << 20)
+        for page_num in range(len(self.doc)):
+            yield self.extract_page_layout(page_num)
+            # store_size is a property on some builds, a function on others,
+            # and unimplemented (None) on a few — without a reading, fall
+            # back to the partial shrink every page
+            size = fitz.TOOLS.store_size
+            if callable(size):
+                size = size()
+            if size is None or size > max_store_bytes:
+                fitz.TOOLS.store_shrink(50)
+
     def extract_all_pages(self) -> List[PageLayout]:
         """Extract layout information from all pages"""
-        layouts = []
-        for page_num in range(len(self.doc)):
-            layout = self.extract_page_layout(page_num)
-            layouts.append(layout)
-        return layouts
-    
-    def save_to_json(self, output_path: str, layouts: List[PageLayout]):
-        """Save extracted layouts to JSON file"""
-        data = {
-            'pdf_path': self.pdf_path,
-            'total_pages': len(layouts),
-            'pages': [asdict(layout) for layout in layouts]
-        }
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        return list(self.iter_page_layouts())
+
+    def extract_all_pages_parallel(self, workers: Optional[int] = None) -> List[PageLayout]:
+        """Extract all pages in parallel across a process pool.
+
+        Pages are independent, and MuPDF parsing doesn't benefit from
+        threads (the GIL is held), so the work is spread over processes.
+        The PDF bytes are loaded once into shared memory and every worker
+        opens its document from them, avoiding one file read per worker.
+        Results come back in page order via executor.map.
+        """
+        page_count = len(self.doc)
+        if page_count <= 1:
+            return self.extract_all_pages()
+
+        if workers is None:
+            workers = min(os.cpu_count() or 1, 8)
+
+        with open(self.pdf_path, 'rb') as f:
+            data = f.read()
+
+        shm = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            shm.buf[:len(data)] = data
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(
+                    _extract_page_worker,
+                    [(shm.name, len(data), self.pdf_path, page_num)
+                     for page_num in range(page_count)],
+                    chunksize=4
+                ))
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def save_to_json(self, output_path: str, layouts):
+        """Save extracted layouts to JSON file, streaming one page at a time.
+
+        Accepts any iterable of PageLayout — including iter_page_layouts() —
+        so a whole document never has to be materialized in memory.
+        total_pages is emitted after the pages array since a generator's
+        length isn't known up front.
+        """
+        with open(output_path, 'wb') as f:
+            f.write(b'{"pdf_path": %s, "pages": [' % _dumps(self.pdf_path))
+            total_pages = 0
+            for layout in layouts:
+                if total_pages:
+                    f.write(b', ')
+                f.write(_dumps(layout.to_dict()))
+                total_pages += 1
+            f.write(b'], "total_pages": %d}' % total_pages)
     
     def close(self):
         """Close the PDF document"""
         self.doc.close()
 
+def _extract_page_worker(args: Tuple[str, int, str, int]) -> PageLayout:
+    """Process-pool worker: map the shared PDF bytes and extract one page."""
+    shm_name, size, pdf_path, page_num = args
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        extractor = PDFColumnExtractor(pdf_path, stream=bytes(shm.buf[:size]))
+        try:
+            return extractor.extract_page_layout(page_num)
+        finally:
+            extractor.close()
+    finally:
+        shm.close()
+
 def main():
     # Example usage
     pdf_path = "./data_dir/document.pdf"  # Replace with your PDF path
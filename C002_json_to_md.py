@@ -2,6 +2,14 @@ import json
 import os
 from typing import Dict, List, Tuple, Optional
 
+# orjson is optional: parsing a whole-document layout dump is the main
+# cost of this script, and orjson.loads is several times faster than the
+# stdlib parser on large files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Define dataclasses (though not strictly necessary for this script, it helps
 # in understanding the structure of the data being processed if you were to
 # load it into these objects)
@@ -32,13 +40,14 @@ def json_to_markdown(json_input_path: str, markdown_output_path: str):
         markdown_output_path (str): Path where the output Markdown file will be saved.
     """
     try:
-        with open(json_input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_input_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except FileNotFoundError:
         print(f"Error: JSON input file not found at {json_input_path}")
         print("Please ensure 'extracted_layout_document_layoutlm.json' exists in your 'data_dir'.")
         return
-    except json.JSONDecodeError:
+    except ValueError:
         print(f"Error: Could not decode JSON from {json_input_path}. Check file format.")
         return
 
@@ -4,8 +4,48 @@ Pytest configuration for PDF layout snapshot testing.
 This module configures pytest and syrupy for snapshot testing of PDF extractors.
 """
 
+import hashlib
+import json
+
 import pytest
 from pathlib import Path
+from syrupy.extensions.single_file import SingleFileSnapshotExtension
+
+
+class HashedJSONExtension(SingleFileSnapshotExtension):
+    """
+    Single-file JSON snapshot extension with a content-hash fast path.
+
+    Each snapshot file stores {"hash": ..., "data": ...} where the hash
+    covers the canonical JSON of the data. Matching compares the hashes
+    first, so a passing run costs one serialize+hash instead of a deep
+    structural comparison of the full multi-page dict.
+    """
+
+    file_extension = "json"
+
+    @staticmethod
+    def _canonical_hash(payload: bytes) -> str:
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def serialize(self, data, *, exclude=None, include=None, matcher=None):
+        canonical = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        digest = self._canonical_hash(canonical.encode('utf-8'))
+        return json.dumps(
+            {'hash': digest, 'data': data},
+            sort_keys=True,
+            indent=2,
+            ensure_ascii=False
+        ).encode('utf-8')
+
+    def matches(self, *, serialized_data, snapshot_data):
+        try:
+            new_hash = json.loads(serialized_data)['hash']
+            old_hash = json.loads(snapshot_data)['hash']
+        except (ValueError, TypeError, KeyError):
+            # Malformed or legacy snapshot: fall back to full comparison
+            return bool(serialized_data == snapshot_data)
+        return new_hash == old_hash
 
 
 @pytest.fixture
@@ -14,16 +54,20 @@ def snapshot(snapshot):
     Syrupy snapshot fixture with custom configuration.
 
     The snapshot fixture is provided by syrupy and automatically handles
-    snapshot creation, comparison, and updates.
+    snapshot creation, comparison, and updates. Snapshots are stored as
+    hashed single-file JSON (see HashedJSONExtension) so unchanged runs
+    short-circuit on the content hash.
     """
-    return snapshot
+    return snapshot.use_extension(HashedJSONExtension)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def data_dir():
     """
     Fixture providing the path to test data directory.
 
+    Session-scoped so the path is built once per test run.
+
     Returns:
         Path: Path to the data_dir directory where test PDFs are stored
 
@@ -34,11 +78,14 @@ def data_dir():
     return Path(__file__).parent.parent / "data_dir"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_pdf_path(data_dir):
     """
     Fixture providing a default test PDF path.
 
+    Session-scoped so the existence check stats the file once per run
+    instead of once per test.
+
     Returns:
         Path: Path to document.pdf if it exists, otherwise None
 
@@ -52,6 +99,32 @@ def test_pdf_path(data_dir):
     return pdf_path if pdf_path.exists() else None
 
 
+@pytest.fixture
+def cached_extract():
+    """
+    Fixture wrapping extract_with_implementation with the on-disk cache on.
+
+    Results are cached under .pytest_cache/pdf_layout keyed by the PDF's
+    mtime and size, so re-running unchanged tests skips extraction.
+
+    Usage:
+        def test_something(test_pdf_path, cached_extract):
+            result = cached_extract(test_pdf_path, 1, extractor_class)
+    """
+    from pdf_layout_tester import extract_with_implementation
+
+    def _extract(pdf_path, pages, extractor_class, **kwargs):
+        kwargs.setdefault('use_cache', True)
+        return extract_with_implementation(
+            pdf_path=pdf_path,
+            pages=pages,
+            extractor_class=extractor_class,
+            **kwargs
+        )
+
+    return _extract
+
+
 def pytest_configure(config):
     """
     Pytest configuration hook.
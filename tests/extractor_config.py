@@ -5,6 +5,10 @@ This file defines which extractor should be used for each PDF file.
 This allows different PDFs to use different extraction strategies while
 maintaining the same testing code.
 
+Extractors are registered as lazy "module:ClassName" specs and resolved on
+first use, so pytest collection does not pay the import cost of every
+extractor module (and its PDF-library dependencies) up front.
+
 Usage:
     from extractor_config import get_extractor_for_pdf
 
@@ -16,46 +20,53 @@ Usage:
     )
 """
 
-from typing import Dict, Type, Optional
+from typing import Dict, Type, Optional, Union
+from functools import lru_cache
 from pathlib import Path
-
-# Import available extractors
-from A003_colored_footer import PDFColumnExtractor
-
-# You can import other extractors as they become available
-# from A002_header_footer_2_col import SimpleExtractor
-# from custom_extractor import CustomExtractor
+import importlib
 
 
 # PDF -> Extractor mapping
 # Key: PDF filename (without path)
-# Value: Extractor class to use
-EXTRACTOR_MAP: Dict[str, Type] = {
+# Value: Lazy "module:ClassName" spec (or an already-imported class)
+EXTRACTOR_MAP: Dict[str, Union[str, Type]] = {
     # Example mappings - update these based on your test PDFs
-    "document.pdf": PDFColumnExtractor,
+    "document.pdf": "A003_colored_footer:PDFColumnExtractor",
 
     # Add more mappings as needed:
-    # "academic_paper.pdf": PDFColumnExtractor,
-    # "simple_doc.pdf": SimpleExtractor,
-    # "complex_layout.pdf": CustomExtractor,
+    # "academic_paper.pdf": "A003_colored_footer:PDFColumnExtractor",
+    # "simple_doc.pdf": "A002_header_footer_2_col:SimpleExtractor",
+    # "complex_layout.pdf": "custom_extractor:CustomExtractor",
 }
 
 
 # Default extractor to use when PDF is not in the map
-DEFAULT_EXTRACTOR = PDFColumnExtractor
+DEFAULT_EXTRACTOR = "A003_colored_footer:PDFColumnExtractor"
+
+
+@lru_cache(maxsize=None)
+def _resolve(spec: str) -> Type:
+    """
+    Import and return the extractor class named by a "module:ClassName" spec.
+
+    Cached so each extractor module is imported at most once per process.
+    """
+    module_name, class_name = spec.split(':')
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def get_extractor_for_pdf(
     pdf_path: str,
-    default: Optional[Type] = None
+    default: Optional[Union[str, Type]] = None
 ) -> Type:
     """
     Get the appropriate extractor class for a PDF file.
 
     Args:
         pdf_path: Path to the PDF file (can be full path or just filename)
-        default: Optional default extractor to use if PDF not in map.
-                 If None, uses DEFAULT_EXTRACTOR.
+        default: Optional default extractor (class or "module:ClassName"
+                 spec) to use if PDF not in map. If None, uses
+                 DEFAULT_EXTRACTOR.
 
     Returns:
         Extractor class to use for this PDF
@@ -68,18 +79,18 @@ def get_extractor_for_pdf(
     # Extract filename from path
     filename = Path(pdf_path).name
 
-    # Look up in map
-    if filename in EXTRACTOR_MAP:
-        return EXTRACTOR_MAP[filename]
-
-    # Use default
-    if default is not None:
-        return default
+    # Look up in map, falling back to the caller's default or the global one
+    spec = EXTRACTOR_MAP.get(filename)
+    if spec is None:
+        spec = default if default is not None else DEFAULT_EXTRACTOR
 
-    return DEFAULT_EXTRACTOR
+    # Resolve lazy specs; already-imported classes pass through untouched
+    if isinstance(spec, str):
+        return _resolve(spec)
+    return spec
 
 
-def register_extractor(pdf_filename: str, extractor_class: Type):
+def register_extractor(pdf_filename: str, extractor_class: Union[str, Type]):
     """
     Register a new PDF -> Extractor mapping.
 
@@ -87,11 +98,10 @@ def register_extractor(pdf_filename: str, extractor_class: Type):
 
     Args:
         pdf_filename: Filename of the PDF (without path)
-        extractor_class: Extractor class to use
+        extractor_class: Extractor class or "module:ClassName" spec to use
 
     Example:
-        >>> from custom_extractor import MyExtractor
-        >>> register_extractor("special.pdf", MyExtractor)
+        >>> register_extractor("special.pdf", "custom_extractor:MyExtractor")
     """
     EXTRACTOR_MAP[pdf_filename] = extractor_class
 
@@ -108,7 +118,8 @@ def list_registered_pdfs() -> Dict[str, str]:
         >>> for pdf, extractor in mappings.items():
         ...     print(f"{pdf} -> {extractor}")
     """
+    # Derive names from lazy specs without importing the modules
     return {
-        pdf: extractor.__name__
-        for pdf, extractor in EXTRACTOR_MAP.items()
+        pdf: spec.split(':')[1] if isinstance(spec, str) else spec.__name__
+        for pdf, spec in EXTRACTOR_MAP.items()
     }
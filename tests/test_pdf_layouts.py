@@ -25,13 +25,30 @@ import pytest
 from pathlib import Path
 
 from pdf_layout_tester import (
-    extract_with_implementation,
     extract_all_pages,
     PageRange,
-    parse_pages_argument
+    parse_pages_argument,
+    _extract_pages_with_instance
 )
+from pdf_extractor_protocol import normalize_layout_for_snapshot
 from tests.extractor_config import get_extractor_for_pdf
-from A003_colored_footer import PDFColumnExtractor
+
+
+@pytest.fixture(scope="module")
+def shared_extractor(test_pdf_path):
+    """
+    Open the test PDF's extractor once for the whole module.
+
+    The snapshot tests below only read pages, so they can share a single
+    open/parse of the document instead of paying it per test.
+    """
+    if test_pdf_path is None:
+        pytest.skip("No test PDF available")
+
+    extractor_class = get_extractor_for_pdf(test_pdf_path)
+    extractor = extractor_class(str(test_pdf_path))
+    yield extractor
+    extractor.close()
 
 
 # ============================================================================
@@ -87,101 +104,57 @@ class TestPageParsing:
         with pytest.raises(ValueError):
             parse_pages_argument("invalid")
 
+        with pytest.raises(ValueError):
+            parse_pages_argument("1.5")  # Not a page list
+
+        with pytest.raises(ValueError):
+            parse_pages_argument("1-5x")  # Trailing garbage
+
+        with pytest.raises(ValueError):
+            parse_pages_argument("1;3")  # Wrong separator
+
 
 # ============================================================================
-# Snapshot Tests - Single Page Extraction
+# Snapshot Tests - Page Extraction
 # ============================================================================
 
-class TestSinglePageExtraction:
+class TestPageExtraction:
     """
-    Test extraction of single pages from PDFs.
+    Test extraction of single and multiple pages from PDFs.
 
     These tests create snapshots of the extraction output. On first run,
     they create the snapshot files. On subsequent runs, they compare against
-    the saved snapshots.
+    the saved snapshots. All page specs share one extractor open via the
+    module-scoped shared_extractor fixture.
     """
 
     @pytest.mark.snapshot
     @pytest.mark.extractor("PDFColumnExtractor")
-    def test_extract_first_page(self, test_pdf_path, snapshot):
-        """Test extraction of the first page."""
-        if test_pdf_path is None:
-            pytest.skip("No test PDF available")
-
-        extractor_class = get_extractor_for_pdf(test_pdf_path)
-        result = extract_with_implementation(
-            pdf_path=test_pdf_path,
-            pages=1,
-            extractor_class=extractor_class
-        )
-
-        # Compare normalized output against snapshot
-        assert result.to_dict(normalize=True) == snapshot
-
-    @pytest.mark.snapshot
-    @pytest.mark.extractor("PDFColumnExtractor")
-    def test_extract_second_page(self, test_pdf_path, snapshot):
-        """Test extraction of the second page."""
-        if test_pdf_path is None:
-            pytest.skip("No test PDF available")
-
-        extractor_class = get_extractor_for_pdf(test_pdf_path)
+    @pytest.mark.parametrize(
+        "pages",
+        [1, 2, PageRange(1, 3), [1, 3]],
+        ids=["first_page", "second_page", "page_range", "specific_pages"]
+    )
+    def test_extract_pages(self, shared_extractor, pages, snapshot):
+        """Test extraction of various page specifications."""
+        page_numbers = parse_pages_argument(pages)
 
         try:
-            result = extract_with_implementation(
-                pdf_path=test_pdf_path,
-                pages=2,
-                extractor_class=extractor_class
-            )
-            assert result.to_dict(normalize=True) == snapshot
+            layouts = _extract_pages_with_instance(shared_extractor, page_numbers)
         except IndexError:
-            pytest.skip("PDF has fewer than 2 pages")
+            pytest.skip(f"PDF has fewer than {max(page_numbers)} pages")
+
+        # Compare normalized output against snapshot
+        normalized = [normalize_layout_for_snapshot(layout) for layout in layouts]
+        assert normalized == snapshot
 
 
 # ============================================================================
-# Snapshot Tests - Multiple Page Extraction
+# Snapshot Tests - All-Pages Extraction
 # ============================================================================
 
-class TestMultiplePageExtraction:
-    """Test extraction of multiple pages."""
-
-    @pytest.mark.snapshot
-    @pytest.mark.extractor("PDFColumnExtractor")
-    def test_extract_page_range(self, test_pdf_path, snapshot):
-        """Test extraction of a range of pages."""
-        if test_pdf_path is None:
-            pytest.skip("No test PDF available")
-
-        extractor_class = get_extractor_for_pdf(test_pdf_path)
-
-        try:
-            result = extract_with_implementation(
-                pdf_path=test_pdf_path,
-                pages=PageRange(1, 3),
-                extractor_class=extractor_class
-            )
-            assert result.to_dict(normalize=True) == snapshot
-        except IndexError:
-            pytest.skip("PDF has fewer than 3 pages")
-
-    @pytest.mark.snapshot
-    @pytest.mark.extractor("PDFColumnExtractor")
-    def test_extract_specific_pages(self, test_pdf_path, snapshot):
-        """Test extraction of specific non-consecutive pages."""
-        if test_pdf_path is None:
-            pytest.skip("No test PDF available")
-
-        extractor_class = get_extractor_for_pdf(test_pdf_path)
-
-        try:
-            result = extract_with_implementation(
-                pdf_path=test_pdf_path,
-                pages=[1, 3],  # Non-consecutive pages
-                extractor_class=extractor_class
-            )
-            assert result.to_dict(normalize=True) == snapshot
-        except IndexError:
-            pytest.skip("PDF has fewer than 3 pages")
+class TestAllPagesExtraction:
+    """Test whole-document extraction."""
 
     @pytest.mark.snapshot
     @pytest.mark.slow
@@ -210,20 +183,18 @@ class TestLayoutStructure:
     Test the structure and content of extracted layouts.
 
     These tests verify that the extractors produce the expected structure
-    without using snapshots.
+    without using snapshots. They go through the cached_extract fixture, so
+    repeated runs against an unchanged PDF reuse the on-disk result cache
+    instead of re-extracting.
     """
 
-    def test_layout_has_required_fields(self, test_pdf_path):
+    def test_layout_has_required_fields(self, test_pdf_path, cached_extract):
         """Test that extracted layouts have all required fields."""
         if test_pdf_path is None:
             pytest.skip("No test PDF available")
 
         extractor_class = get_extractor_for_pdf(test_pdf_path)
-        result = extract_with_implementation(
-            pdf_path=test_pdf_path,
-            pages=1,
-            extractor_class=extractor_class
-        )
+        result = cached_extract(test_pdf_path, 1, extractor_class)
 
         # Check that we got results
         assert len(result.pages) == 1
@@ -250,7 +221,7 @@ class TestLayoutStructure:
         assert isinstance(layout.page_height, float)
         assert isinstance(layout.metadata, dict)
 
-    def test_page_numbers_are_sequential(self, test_pdf_path):
+    def test_page_numbers_are_sequential(self, test_pdf_path, cached_extract):
         """Test that page numbers in results are sequential and correct."""
         if test_pdf_path is None:
             pytest.skip("No test PDF available")
@@ -258,28 +229,20 @@ class TestLayoutStructure:
         extractor_class = get_extractor_for_pdf(test_pdf_path)
 
         try:
-            result = extract_with_implementation(
-                pdf_path=test_pdf_path,
-                pages=PageRange(1, 3),
-                extractor_class=extractor_class
-            )
+            result = cached_extract(test_pdf_path, PageRange(1, 3), extractor_class)
 
             page_numbers = [layout.page_number for layout in result.pages]
             assert page_numbers == [1, 2, 3]
         except IndexError:
             pytest.skip("PDF has fewer than 3 pages")
 
-    def test_metadata_contains_blocks_count(self, test_pdf_path):
+    def test_metadata_contains_blocks_count(self, test_pdf_path, cached_extract):
         """Test that metadata contains text block counts."""
         if test_pdf_path is None:
             pytest.skip("No test PDF available")
 
         extractor_class = get_extractor_for_pdf(test_pdf_path)
-        result = extract_with_implementation(
-            pdf_path=test_pdf_path,
-            pages=1,
-            extractor_class=extractor_class
-        )
+        result = cached_extract(test_pdf_path, 1, extractor_class)
 
         layout = result.pages[0]
         metadata = layout.metadata